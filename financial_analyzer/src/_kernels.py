@@ -0,0 +1,219 @@
+import numpy as np
+import pandas as pd
+from typing import Tuple
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; fall back to pandas rolling windows
+    njit = None
+    prange = range
+
+SMA_SHORT_WINDOW = 50
+SMA_LONG_WINDOW = 200
+HIGH_52W_WINDOW = 252
+
+
+def _compute_metrics_loop(
+    close: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Single pass over the close prices producing SMA-50, SMA-200, 52-week high, % from high
+    and the golden/death cross masks (SMA-50 crossing above/below SMA-200 on that day).
+    SMAs use running sums; the rolling max uses a monotonic deque of indices. Windows are
+    partial at the start of the series and NaN closes are skipped inside a window (same as
+    pandas ``min_periods=1``); a window with no valid close yields NaN.
+    """
+    n = close.shape[0]
+    sma_50 = np.empty(n)
+    sma_200 = np.empty(n)
+    high_52w = np.empty(n)
+    pct_from_high = np.empty(n)
+    golden_cross = np.zeros(n, dtype=np.bool_)
+    death_cross = np.zeros(n, dtype=np.bool_)
+    sum_50 = 0.0
+    sum_200 = 0.0
+    count_50 = 0
+    count_200 = 0
+    deque = np.empty(n, dtype=np.int64)
+    head = 0
+    tail = 0
+    for i in range(n):
+        c = close[i]
+        valid = c == c
+        if valid:
+            sum_50 += c
+            sum_200 += c
+            count_50 += 1
+            count_200 += 1
+        if i >= SMA_SHORT_WINDOW:
+            old = close[i - SMA_SHORT_WINDOW]
+            if old == old:
+                sum_50 -= old
+                count_50 -= 1
+        if i >= SMA_LONG_WINDOW:
+            old = close[i - SMA_LONG_WINDOW]
+            if old == old:
+                sum_200 -= old
+                count_200 -= 1
+        # Reset empty windows so rounding residue from the running sums does not carry over
+        if count_50 == 0:
+            sum_50 = 0.0
+        if count_200 == 0:
+            sum_200 = 0.0
+        sma_50[i] = sum_50 / count_50 if count_50 > 0 else np.nan
+        sma_200[i] = sum_200 / count_200 if count_200 > 0 else np.nan
+
+        if valid:
+            while tail > head and close[deque[tail - 1]] <= c:
+                tail -= 1
+            deque[tail] = i
+            tail += 1
+        if tail > head and deque[head] <= i - HIGH_52W_WINDOW:
+            head += 1
+        high_52w[i] = close[deque[head]] if tail > head else np.nan
+        pct_from_high[i] = (c / high_52w[i] - 1.0) * 100.0
+
+        if i > 0:
+            if sma_50[i - 1] <= sma_200[i - 1] and sma_50[i] > sma_200[i]:
+                golden_cross[i] = True
+            elif sma_50[i - 1] >= sma_200[i - 1] and sma_50[i] < sma_200[i]:
+                death_cross[i] = True
+    return sma_50, sma_200, high_52w, pct_from_high, golden_cross, death_cross
+
+
+def _compute_metrics_pandas(
+    close: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Fallback used when numba is not installed."""
+    series = pd.Series(close)
+    sma_50 = series.rolling(window=SMA_SHORT_WINDOW, min_periods=1).mean().to_numpy()
+    sma_200 = series.rolling(window=SMA_LONG_WINDOW, min_periods=1).mean().to_numpy()
+    high_52w = series.rolling(window=HIGH_52W_WINDOW, min_periods=1).max().to_numpy()
+    golden_cross = np.zeros(len(close), dtype=bool)
+    death_cross = np.zeros(len(close), dtype=bool)
+    golden_cross[1:] = (sma_50[:-1] <= sma_200[:-1]) & (sma_50[1:] > sma_200[1:])
+    death_cross[1:] = (sma_50[:-1] >= sma_200[:-1]) & (sma_50[1:] < sma_200[1:])
+    return sma_50, sma_200, high_52w, (close / high_52w - 1) * 100, golden_cross, death_cross
+
+
+compute_metrics = (
+    njit(cache=True)(_compute_metrics_loop) if njit is not None else _compute_metrics_pandas
+)
+
+
+def _find_crosses_loop(
+    sma_50: np.ndarray, sma_200: np.ndarray, golden_out: np.ndarray, death_out: np.ndarray
+) -> Tuple[int, int]:
+    """
+    Streaming crossover scan: writes row positions of golden/death crosses into the
+    preallocated output buffers and returns how many of each were found. Rows where
+    either SMA is NaN are skipped, so each valid row is compared with the previous valid one.
+    Positions past the end of a buffer are counted but not written, so empty buffers give a
+    count-only pass. Every ``_find_crosses_jit`` implementation (this loop, its numba build
+    and the Cython ``_signals_fast.find_crosses``) honours that guard.
+    """
+    n_golden = 0
+    n_death = 0
+    prev_sign = 2  # no valid row seen yet
+    for i in range(sma_50.shape[0]):
+        diff = sma_50[i] - sma_200[i]
+        if diff != diff:
+            continue
+        sign = 1 if diff > 0 else (-1 if diff < 0 else 0)
+        if prev_sign != 2 and sign != prev_sign:
+            if sign == 1:
+                if n_golden < golden_out.shape[0]:
+                    golden_out[n_golden] = i
+                n_golden += 1
+            elif sign == -1:
+                if n_death < death_out.shape[0]:
+                    death_out[n_death] = i
+                n_death += 1
+        prev_sign = sign
+    return n_golden, n_death
+
+
+try:
+    from ._signals_fast import find_crosses as _find_crosses_cython
+except ImportError:  # Cython extension not built (see README); numba or NumPy is used instead
+    _find_crosses_cython = None
+
+HAVE_NUMBA = njit is not None
+HAVE_COMPILED_CROSSES = HAVE_NUMBA or _find_crosses_cython is not None
+_find_crosses_nb = njit(cache=True)(_find_crosses_loop) if HAVE_NUMBA else _find_crosses_loop
+if HAVE_NUMBA:
+    _find_crosses_jit = _find_crosses_nb
+elif _find_crosses_cython is not None:
+    _find_crosses_jit = _find_crosses_cython
+else:
+    _find_crosses_jit = _find_crosses_loop
+
+
+def find_crosses(sma_50: np.ndarray, sma_200: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Row positions of golden and death crosses, from one compiled pass with no temporaries
+    beyond the output buffers. Meant for long series when numba or the Cython extension
+    is available.
+    """
+    sma_50 = np.ascontiguousarray(sma_50, dtype=np.float64)
+    sma_200 = np.ascontiguousarray(sma_200, dtype=np.float64)
+    golden_out = np.empty(sma_50.shape[0], dtype=np.int64)
+    death_out = np.empty(sma_50.shape[0], dtype=np.int64)
+    n_golden, n_death = _find_crosses_jit(sma_50, sma_200, golden_out, death_out)
+    return golden_out[:n_golden], death_out[:n_death]
+
+
+def _count_crosses_rows_loop(
+    sma_50: np.ndarray, sma_200: np.ndarray, n_golden: np.ndarray, n_death: np.ndarray
+) -> None:
+    """Count golden/death crosses of every row (ticker) of 2-D SMA arrays; rows are independent."""
+    empty = np.empty(0, dtype=np.int64)
+    for t in prange(sma_50.shape[0]):
+        n_golden[t], n_death[t] = _find_crosses_nb(sma_50[t], sma_200[t], empty, empty)
+
+
+def _fill_crosses_rows_loop(
+    sma_50: np.ndarray,
+    sma_200: np.ndarray,
+    golden_starts: np.ndarray,
+    golden_idx: np.ndarray,
+    death_starts: np.ndarray,
+    death_idx: np.ndarray,
+) -> None:
+    """Write each row's cross positions into its own slice of the flat CSR index arrays."""
+    for t in prange(sma_50.shape[0]):
+        _find_crosses_nb(
+            sma_50[t],
+            sma_200[t],
+            golden_idx[golden_starts[t] : golden_starts[t + 1]],
+            death_idx[death_starts[t] : death_starts[t + 1]],
+        )
+
+
+_count_crosses_rows = (
+    njit(parallel=True, cache=True)(_count_crosses_rows_loop) if HAVE_NUMBA else _count_crosses_rows_loop
+)
+_fill_crosses_rows = (
+    njit(parallel=True, cache=True)(_fill_crosses_rows_loop) if HAVE_NUMBA else _fill_crosses_rows_loop
+)
+
+
+def find_crosses_batch(
+    sma_50: np.ndarray, sma_200: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Crossover positions for each row of ``(n_tickers, n_days)`` SMA arrays, scanned in parallel.
+    Returned CSR-style as (golden_starts, golden_idx, death_starts, death_idx): the golden
+    positions of row ``t`` are ``golden_idx[golden_starts[t]:golden_starts[t + 1]]``.
+    A counting pass sizes the flat arrays exactly, then a second pass fills each row's slice,
+    so memory is proportional to the number of crosses rather than tickers x days.
+    """
+    n_golden = np.zeros(sma_50.shape[0], dtype=np.int64)
+    n_death = np.zeros(sma_50.shape[0], dtype=np.int64)
+    _count_crosses_rows(sma_50, sma_200, n_golden, n_death)
+    golden_starts = np.concatenate((np.zeros(1, dtype=np.int64), np.cumsum(n_golden)))
+    death_starts = np.concatenate((np.zeros(1, dtype=np.int64), np.cumsum(n_death)))
+    golden_idx = np.empty(golden_starts[-1], dtype=np.int64)
+    death_idx = np.empty(death_starts[-1], dtype=np.int64)
+    _fill_crosses_rows(sma_50, sma_200, golden_starts, golden_idx, death_starts, death_idx)
+    return golden_starts, golden_idx, death_starts, death_idx
@@ -0,0 +1,40 @@
+# cython: boundscheck=False, wraparound=False, cdivision=True, language_level=3
+"""
+Compiled crossover scan for deployments without numba. Same contract as
+``_kernels._find_crosses_loop``; build with the instructions in the README.
+"""
+
+
+def find_crosses(
+    const double[::1] s50,
+    const double[::1] s200,
+    long long[::1] out_g,
+    long long[::1] out_d,
+):
+    """
+    Write row positions of golden/death crosses into ``out_g``/``out_d`` and return
+    ``(n_g, n_d)``. Rows where either SMA is NaN are skipped, so each valid row is compared
+    with the previous valid one; a tie (equal SMAs) is its own state and never fires.
+    Positions past the end of a buffer are counted but not written (bounds checking is off,
+    so the guard is explicit); empty buffers give a count-only pass.
+    """
+    cdef Py_ssize_t i, n = s50.shape[0], ng = 0, nd = 0
+    cdef double d
+    cdef int sign, sign_prev = 2  # no valid row seen yet
+    with nogil:
+        for i in range(n):
+            d = s50[i] - s200[i]
+            if d != d:
+                continue
+            sign = (d > 0) - (d < 0)
+            if sign_prev != 2 and sign != sign_prev:
+                if sign == 1:
+                    if ng < out_g.shape[0]:
+                        out_g[ng] = i
+                    ng += 1
+                elif sign == -1:
+                    if nd < out_d.shape[0]:
+                        out_d[nd] = i
+                    nd += 1
+            sign_prev = sign
+    return ng, nd
@@ -1,6 +1,13 @@
+import copy
 import yaml
+from functools import lru_cache
 from pathlib import Path
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # libyaml not available
+    from yaml import SafeLoader
+
 DEFAULT_CONFIG = {
     "database": {"path": "financial_data.db"},
     "logging": {"level": "INFO"},
@@ -8,18 +15,23 @@ DEFAULT_CONFIG = {
 }
 
 
+@lru_cache(maxsize=8)
+def _load_yaml(path: str, mtime_ns: int):
+    """Parse a YAML file; cached per (path, mtime) so unchanged files are parsed once."""
+    with open(path, "r") as f:
+        return yaml.load(f, Loader=SafeLoader) or {}
+
+
 def load_config(config_path: str = "config.yaml"):
     """Load configuration from YAML file, fallback to defaults."""
+    merged = copy.deepcopy(DEFAULT_CONFIG)
     config_file = Path(config_path)
     if config_file.exists():
-        with open(config_file, "r") as f:
-            config = yaml.safe_load(f)
+        config = _load_yaml(str(config_file.resolve()), config_file.stat().st_mtime_ns)
         # Merge with defaults
-        merged = DEFAULT_CONFIG.copy()
-        for k, v in config.items():
+        for k, v in copy.deepcopy(config).items():
             if k in merged and isinstance(merged[k], dict):
                 merged[k].update(v)
             else:
                 merged[k] = v
-        return merged
-    return DEFAULT_CONFIG
+    return merged
@@ -1,93 +1,201 @@
 import yfinance as yf
+import numpy as np
 import pandas as pd
-from decimal import Decimal
-from datetime import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from functools import partial
+from pathlib import Path
 from typing import Dict, Any, List
-from pydantic import ValidationError
-from .models import PriceData, FundamentalData
+from typing_extensions import TypedDict
+from pydantic import TypeAdapter
+from .models import PriceSeries, FundamentalData
 import logging
 
+# Compiled once; validates whole batches in pydantic-core instead of one model call per row
+FUNDAMENTAL_LIST = TypeAdapter(List[FundamentalData])
 
-def fetch_stock_data(ticker: str) -> Dict[str, Any]:
+HISTORY_PERIOD = "5y"
+CACHE_DIR = ".yf_cache"
+CACHE_EXPIRE_SECONDS = 3600
+
+
+class _PriceColumns(TypedDict):
+    date: List[date]
+    open: List[float]
+    high: List[float]
+    low: List[float]
+    close: List[float]
+    volume: List[int]
+
+
+class _FetchResult(TypedDict):
+    prices: _PriceColumns
+    fundamentals: List[FundamentalData]
+
+
+FETCH_RESULT = TypeAdapter(_FetchResult)
+
+# Balance sheet row label for each FundamentalData field
+BALANCE_SHEET_ROWS = {
+    "book_value": "Total Stockholder Equity",
+    "total_assets": "Total Assets",
+    "total_liabilities": "Total Liab",
+}
+
+# yfinance info key for each FundamentalData field
+INFO_FIELDS = {
+    "book_value": "bookValue",
+    "pe_ratio": "trailingPE",
+    "pb_ratio": "priceToBook",
+    "eps": "trailingEps",
+    "revenue": "totalRevenue",
+    "net_income": "netIncomeToCommon",
+    "enterprise_value": "enterpriseValue",
+}
+
+
+def invalid_price_mask(
+    open: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray, volume: np.ndarray
+) -> np.ndarray:
+    """
+    Vectorized form of PriceData.check_price_relationships plus missing-value checks.
+
+    Returns:
+            np.ndarray: Boolean mask, True for rows that must be dropped.
+    """
+    missing = np.isnan(open) | np.isnan(high) | np.isnan(low) | np.isnan(close) | np.isnan(volume)
+    return (
+        missing
+        | (high < low)
+        | (open < low)
+        | (open > high)
+        | (close < low)
+        | (close > high)
+    )
+
+
+def _optional_float(value):
+    """Return value as float, or None when it is missing/NaN."""
+    return float(value) if value is not None and pd.notna(value) else None
+
+
+def _balance_sheet_rows(sheet: pd.DataFrame, ticker: str, source: str) -> List[Dict[str, Any]]:
+    """Build FundamentalData dicts, one per reporting-date column of a yfinance balance sheet."""
+    rows = []
+    for col in sheet.columns:
+        row = {
+            "as_of": col.date() if hasattr(col, "date") else pd.to_datetime(col).date(),
+            "ticker": ticker,
+            "source": source,
+        }
+        for field, label in BALANCE_SHEET_ROWS.items():
+            row[field] = _optional_float(sheet.at[label, col]) if label in sheet.index else None
+        for field in ("pe_ratio", "pb_ratio", "eps", "revenue", "net_income", "enterprise_value"):
+            row[field] = None
+        rows.append(row)
+    return rows
+
+
+def _cache_path(cache_dir: str, ticker: str) -> Path:
+    """Cache file for a ticker's fetch result, keyed by (ticker, period, date)."""
+    safe_ticker = ticker.replace("/", "_").upper()
+    return Path(cache_dir) / f"{safe_ticker}_{HISTORY_PERIOD}_{date.today().isoformat()}.json"
+
+
+def fetch_stock_data(
+    ticker: str,
+    use_cache: bool = False,
+    cache_dir: str = CACHE_DIR,
+    expire_after: int = CACHE_EXPIRE_SECONDS,
+) -> Dict[str, Any]:
     """
     Fetch 5 years of daily OHLCV and fundamental data for a ticker using yfinance.
-    Returns dict with 'prices' (list of PriceData) and 'fundamentals' (list of FundamentalData).
+    Returns dict with 'prices' (PriceSeries) and 'fundamentals' (list of FundamentalData).
     Handles API errors, timeouts, and logs data quality issues.
 
+    With use_cache, a successful result is stored on disk and reused for up to
+    expire_after seconds, so re-running on the same tickers skips the network.
+
     Args:
             ticker (str): Stock ticker symbol (e.g., 'AAPL', 'RELIANCE.NS').
+            use_cache (bool): Read/write the on-disk fetch cache.
+            cache_dir (str): Directory holding cached results.
+            expire_after (int): Maximum age of a cached result in seconds.
 
     Returns:
             Dict[str, Any]: {'prices': [...], 'fundamentals': [...]}
     """
-    result = {"prices": [], "fundamentals": []}
+    if not use_cache:
+        return _download_stock_data(ticker)
+    path = _cache_path(cache_dir, ticker)
+    try:
+        if path.exists() and time.time() - path.stat().st_mtime < expire_after:
+            cached = FETCH_RESULT.validate_json(path.read_bytes())
+            return {
+                "prices": PriceSeries.from_columns(cached["prices"]),
+                "fundamentals": cached["fundamentals"],
+            }
+    except Exception as e:
+        logging.warning(f"Ignoring unreadable cache entry {path}: {e}")
+    result = _download_stock_data(ticker)
+    if len(result["prices"]):
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            cached = {
+                "prices": result["prices"].to_columns(),
+                "fundamentals": result["fundamentals"],
+            }
+            path.write_bytes(FETCH_RESULT.dump_json(cached))
+        except OSError as e:
+            logging.warning(f"Could not write cache entry {path}: {e}")
+    return result
+
+
+def _download_stock_data(ticker: str) -> Dict[str, Any]:
+    """Fetch and validate prices and fundamentals for a ticker from yfinance."""
+    result = {"prices": PriceSeries.from_prices([]), "fundamentals": []}
     try:
         stock = yf.Ticker(ticker)
-        # Fetch daily OHLCV (5y)
-        df = stock.history(period="5y", interval="1d")
+        # Fetch daily OHLCV (5y) and the quarterly balance sheet concurrently
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            history_future = pool.submit(stock.history, period=HISTORY_PERIOD, interval="1d")
+            quarterly_future = pool.submit(lambda: stock.quarterly_balance_sheet)
+        df = history_future.result()
         if df.empty:
             logging.error(f"No price data for {ticker}")
             return result
-        df = df.reset_index()
-        for _, row in df.iterrows():
-            try:
-                price = PriceData(
-                    date=(
-                        row["Date"].date()
-                        if hasattr(row["Date"], "date")
-                        else pd.to_datetime(row["Date"]).date()
-                    ),
-                    open=Decimal(str(row["Open"])),
-                    high=Decimal(str(row["High"])),
-                    low=Decimal(str(row["Low"])),
-                    close=Decimal(str(row["Close"])),
-                    volume=int(row["Volume"]),
-                )
-                result["prices"].append(price)
-            except (ValidationError, Exception) as e:
-                logging.warning(f"Invalid price row for {ticker} on {row['Date']}: {e}")
+        index = pd.DatetimeIndex(df.index)
+        if index.tz is not None:
+            index = index.tz_localize(None)
+        columns = {
+            "date": index.to_numpy(),
+            "open": df["Open"].to_numpy(np.float64),
+            "high": df["High"].to_numpy(np.float64),
+            "low": df["Low"].to_numpy(np.float64),
+            "close": df["Close"].to_numpy(np.float64),
+            "volume": df["Volume"].to_numpy(np.float64),
+        }
+        # Validate OHLC relationships for the whole history in one NumPy pass
+        bad = invalid_price_mask(**{k: v for k, v in columns.items() if k != "date"})
+        if bad.any():
+            logging.warning(
+                f"Dropping {int(bad.sum())} invalid price rows for {ticker}: "
+                f"{[str(d) for d in columns['date'][bad].astype('datetime64[D]')]}"
+            )
+            columns = {name: values[~bad] for name, values in columns.items()}
+        # Keep prices column-wise: one contiguous array per field
+        result["prices"] = PriceSeries.from_columns(columns)
 
         # Fundamental data strategy
         fundamentals = []
-        source = None
         # Try quarterly balance sheet
         try:
-            qbs = stock.quarterly_balance_sheet
+            qbs = quarterly_future.result()
             if not qbs.empty:
-                source = "quarterly"
-                for col in qbs.columns:
-                    fundamentals.append(
-                        FundamentalData(
-                            as_of=(
-                                col.date() if hasattr(col, "date") else pd.to_datetime(col).date()
-                            ),
-                            ticker=ticker,
-                            book_value=(
-                                Decimal(str(qbs.at["Total Stockholder Equity", col]))
-                                if "Total Stockholder Equity" in qbs.index
-                                and pd.notna(qbs.at["Total Stockholder Equity", col])
-                                else None
-                            ),
-                            total_assets=(
-                                Decimal(str(qbs.at["Total Assets", col]))
-                                if "Total Assets" in qbs.index
-                                and pd.notna(qbs.at["Total Assets", col])
-                                else None
-                            ),
-                            total_liabilities=(
-                                Decimal(str(qbs.at["Total Liab", col]))
-                                if "Total Liab" in qbs.index and pd.notna(qbs.at["Total Liab", col])
-                                else None
-                            ),
-                            pe_ratio=None,
-                            pb_ratio=None,
-                            eps=None,
-                            revenue=None,
-                            net_income=None,
-                            enterprise_value=None,
-                            source=source,
-                        )
-                    )
+                fundamentals = FUNDAMENTAL_LIST.validate_python(
+                    _balance_sheet_rows(qbs, ticker, "quarterly")
+                )
         except Exception as e:
             logging.info(f"Quarterly balance sheet not available for {ticker}: {e}")
 
@@ -96,43 +204,9 @@ def fetch_stock_data(ticker: str) -> Dict[str, Any]:
             try:
                 abs_ = stock.balance_sheet
                 if not abs_.empty:
-                    source = "annual"
-                    for col in abs_.columns:
-                        fundamentals.append(
-                            FundamentalData(
-                                as_of=(
-                                    col.date()
-                                    if hasattr(col, "date")
-                                    else pd.to_datetime(col).date()
-                                ),
-                                ticker=ticker,
-                                book_value=(
-                                    Decimal(str(abs_.at["Total Stockholder Equity", col]))
-                                    if "Total Stockholder Equity" in abs_.index
-                                    and pd.notna(abs_.at["Total Stockholder Equity", col])
-                                    else None
-                                ),
-                                total_assets=(
-                                    Decimal(str(abs_.at["Total Assets", col]))
-                                    if "Total Assets" in abs_.index
-                                    and pd.notna(abs_.at["Total Assets", col])
-                                    else None
-                                ),
-                                total_liabilities=(
-                                    Decimal(str(abs_.at["Total Liab", col]))
-                                    if "Total Liab" in abs_.index
-                                    and pd.notna(abs_.at["Total Liab", col])
-                                    else None
-                                ),
-                                pe_ratio=None,
-                                pb_ratio=None,
-                                eps=None,
-                                revenue=None,
-                                net_income=None,
-                                enterprise_value=None,
-                                source=source,
-                            )
-                        )
+                    fundamentals = FUNDAMENTAL_LIST.validate_python(
+                        _balance_sheet_rows(abs_, ticker, "annual")
+                    )
             except Exception as e:
                 logging.info(f"Annual balance sheet not available for {ticker}: {e}")
 
@@ -140,51 +214,16 @@ def fetch_stock_data(ticker: str) -> Dict[str, Any]:
         if not fundamentals:
             try:
                 info = stock.info
-                source = "info"
-                fundamentals.append(
-                    FundamentalData(
-                        as_of=datetime.now().date(),
-                        ticker=ticker,
-                        book_value=(
-                            Decimal(str(info.get("bookValue")))
-                            if info.get("bookValue") is not None
-                            else None
-                        ),
-                        total_assets=None,
-                        total_liabilities=None,
-                        pe_ratio=(
-                            Decimal(str(info.get("trailingPE")))
-                            if info.get("trailingPE") is not None
-                            else None
-                        ),
-                        pb_ratio=(
-                            Decimal(str(info.get("priceToBook")))
-                            if info.get("priceToBook") is not None
-                            else None
-                        ),
-                        eps=(
-                            Decimal(str(info.get("trailingEps")))
-                            if info.get("trailingEps") is not None
-                            else None
-                        ),
-                        revenue=(
-                            Decimal(str(info.get("totalRevenue")))
-                            if info.get("totalRevenue") is not None
-                            else None
-                        ),
-                        net_income=(
-                            Decimal(str(info.get("netIncomeToCommon")))
-                            if info.get("netIncomeToCommon") is not None
-                            else None
-                        ),
-                        enterprise_value=(
-                            Decimal(str(info.get("enterpriseValue")))
-                            if info.get("enterpriseValue") is not None
-                            else None
-                        ),
-                        source=source,
-                    )
-                )
+                row = {
+                    "as_of": datetime.now().date(),
+                    "ticker": ticker,
+                    "total_assets": None,
+                    "total_liabilities": None,
+                    "source": "info",
+                }
+                for field, key in INFO_FIELDS.items():
+                    row[field] = _optional_float(info.get(key))
+                fundamentals = FUNDAMENTAL_LIST.validate_python([row])
             except Exception as e:
                 logging.error(f"No fundamental data for {ticker}: {e}")
 
@@ -193,3 +232,24 @@ def fetch_stock_data(ticker: str) -> Dict[str, Any]:
     except Exception as e:
         logging.error(f"Failed to fetch data for {ticker}: {e}")
         return result
+
+
+def fetch_many_stock_data(
+    tickers: List[str], max_workers: int = 16, use_cache: bool = False
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Fetch data for several tickers concurrently (network-bound, so threads suffice).
+
+    Args:
+            tickers (List[str]): Stock ticker symbols.
+            max_workers (int): Upper bound on concurrent fetches.
+            use_cache (bool): Read/write the on-disk fetch cache.
+
+    Returns:
+            Dict[str, Dict[str, Any]]: Mapping of ticker to its fetch_stock_data result.
+    """
+    if not tickers:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(tickers))) as pool:
+        fetch = partial(fetch_stock_data, use_cache=use_cache)
+        return dict(zip(tickers, pool.map(fetch, tickers)))
@@ -7,9 +7,11 @@ from sqlalchemy import (
     Numeric,
     UniqueConstraint,
     ForeignKey,
+    Index,
+    event,
 )
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import declarative_base, sessionmaker, relationship
-from sqlalchemy.exc import IntegrityError
 import pandas as pd
 import logging
 
@@ -49,6 +51,9 @@ class SignalEvent(Base):
     meta = Column(String, nullable=True)
     __table_args__ = (
         UniqueConstraint("ticker", "date", "signal_type", name="_ticker_date_signal_uc"),
+        # (ticker, date) range scans are served by the unique index prefix; this one covers
+        # "signals of one type for a ticker between two dates"
+        Index("ix_signal_ticker_type_date", "ticker", "signal_type", "date"),
     )
 
 
@@ -62,12 +67,30 @@ def get_engine(db_path: str = "financial_data.db"):
     Returns:
             Engine: SQLAlchemy engine instance.
     """
-    return create_engine(f"sqlite:///{db_path}", echo=False, future=True)
+    engine = create_engine(
+        f"sqlite:///{db_path}",
+        echo=False,
+        future=True,
+        connect_args={"check_same_thread": False},
+    )
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_conn, _):
+        cursor = dbapi_conn.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA cache_size=-65536")  # 64 MiB page cache
+        cursor.execute("PRAGMA mmap_size=268435456")  # 256 MiB memory-mapped I/O
+        cursor.close()
+
+    return engine
 
 
 def init_db(db_path: str = "financial_data.db"):
     """
-    Initialize the SQLite database and create all tables.
+    Initialize the SQLite database and create all tables and indexes.
+    Skips the DDL entirely when the schema is already in place.
 
     Args:
             db_path (str): Path to SQLite database file.
@@ -76,59 +99,113 @@ def init_db(db_path: str = "financial_data.db"):
             Engine: SQLAlchemy engine instance.
     """
     engine = get_engine(db_path)
+    expected = {table.name for table in Base.metadata.sorted_tables} | {
+        index.name for table in Base.metadata.sorted_tables for index in table.indexes
+    }
+    with engine.connect() as conn:
+        existing = set(
+            conn.exec_driver_sql(
+                "SELECT name FROM sqlite_master WHERE type IN ('table', 'index')"
+            ).scalars()
+        )
+    if expected <= existing:
+        return engine
     Base.metadata.create_all(engine)
+    # create_all skips existing tables, so backfill indexes added after a DB was created
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(engine, checkfirst=True)
     return engine
 
 
+METRIC_COLUMNS = [
+    "close",
+    "sma_50",
+    "sma_200",
+    "high_52w",
+    "pct_from_high_52w",
+    "book_value_per_share",
+    "price_to_book",
+    "enterprise_value",
+]
+
+
+def _metric_records(ticker: str, df: pd.DataFrame) -> list:
+    """Project a metrics DataFrame onto DailyMetric columns as a list of dicts (NaN -> None)."""
+    rows = df.reindex(columns=["date"] + METRIC_COLUMNS)
+    rows = rows.astype(object).where(rows.notna(), None)
+    records = rows.to_dict(orient="records")
+    for record in records:
+        record["ticker"] = ticker
+    return records
+
+
+def _daily_metrics_upsert():
+    """INSERT ... ON CONFLICT(ticker, date) DO UPDATE, executed once with all rows (executemany)."""
+    stmt = sqlite_insert(DailyMetric)
+    return stmt.on_conflict_do_update(
+        index_elements=["ticker", "date"],
+        set_={c: stmt.excluded[c] for c in METRIC_COLUMNS},
+    )
+
+
 def save_ticker(session, ticker: str, name: str = None):
     """
-    Save or update a ticker in the database.
+    Save or update a ticker in the database. Runs in the caller's transaction.
 
     Args:
             session: SQLAlchemy session.
             ticker (str): Ticker symbol.
             name (str, optional): Ticker name.
     """
-    try:
-        session.merge(Ticker(ticker=ticker, name=name))
-        session.commit()
-    except IntegrityError:
-        session.rollback()
+    stmt = sqlite_insert(Ticker).values(ticker=ticker, name=name)
+    stmt = stmt.on_conflict_do_update(index_elements=["ticker"], set_={"name": stmt.excluded.name})
+    session.execute(stmt)
 
 
 def save_daily_metrics(session, ticker: str, df: pd.DataFrame):
     """
-    Save daily metrics DataFrame to the database.
+    Upsert a daily metrics DataFrame into the database in one executemany statement.
+    Runs in the caller's transaction.
 
     Args:
             session: SQLAlchemy session.
             ticker (str): Ticker symbol.
             df (pd.DataFrame): DataFrame of daily metrics.
     """
-    for _, row in df.iterrows():
+    rows = _metric_records(ticker, df)
+    if not rows:
+        return
+    session.execute(_daily_metrics_upsert(), rows)
+
+
+def save_daily_metrics_bulk(engine, ticker: str, df: pd.DataFrame):
+    """
+    Upsert daily metrics through a Core connection with fsync disabled for the load.
+    Intended for analytical batch loads where the DB can be rebuilt from source data.
+
+    Args:
+            engine: SQLAlchemy engine.
+            ticker (str): Ticker symbol.
+            df (pd.DataFrame): DataFrame of daily metrics.
+    """
+    rows = _metric_records(ticker, df)
+    if not rows:
+        return
+    with engine.connect() as conn:
+        conn.exec_driver_sql("PRAGMA synchronous=OFF")
         try:
-            session.merge(
-                DailyMetric(
-                    ticker=ticker,
-                    date=row["date"],
-                    close=row["close"],
-                    sma_50=row.get("sma_50"),
-                    sma_200=row.get("sma_200"),
-                    high_52w=row.get("high_52w"),
-                    pct_from_high_52w=row.get("pct_from_high_52w"),
-                    book_value_per_share=row.get("book_value_per_share"),
-                    price_to_book=row.get("price_to_book"),
-                    enterprise_value=row.get("enterprise_value"),
-                )
-            )
-            session.commit()
-        except IntegrityError:
-            session.rollback()
+            conn.execute(_daily_metrics_upsert(), rows)
+            conn.commit()
+        finally:
+            # Pooled connections are reused, so restore the engine default
+            conn.exec_driver_sql("PRAGMA synchronous=NORMAL")
 
 
 def save_signal_events(session, ticker: str, signal_type: str, dates: list, meta: str = None):
     """
-    Save signal events to the database.
+    Upsert signal events into the database in one executemany statement.
+    Runs in the caller's transaction.
 
     Args:
             session: SQLAlchemy session.
@@ -137,9 +214,13 @@ def save_signal_events(session, ticker: str, signal_type: str, dates: list, meta
             dates (list): List of dates for the signal.
             meta (str, optional): Additional metadata.
     """
-    for d in dates:
-        try:
-            session.merge(SignalEvent(ticker=ticker, date=d, signal_type=signal_type, meta=meta))
-            session.commit()
-        except IntegrityError:
-            session.rollback()
+    rows = [
+        {"ticker": ticker, "date": d, "signal_type": signal_type, "meta": meta} for d in dates
+    ]
+    if not rows:
+        return
+    stmt = sqlite_insert(SignalEvent)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["ticker", "date", "signal_type"], set_={"meta": stmt.excluded.meta}
+    )
+    session.execute(stmt, rows)
@@ -1,51 +1,48 @@
 import typer
+import importlib.util
 import logging
-import json
+import numpy as np
 import pandas as pd
 from pathlib import Path
-from .data_fetcher import fetch_stock_data
+from .data_fetcher import fetch_many_stock_data
 from .processor import process_data
-from .signals import detect_golden_crossover, detect_death_cross
-from .database import init_db, get_engine, save_ticker, save_daily_metrics, save_signal_events
-from .models import ExportData, SignalEvent
+from .database import init_db, save_ticker, save_daily_metrics, save_signal_events
+from .models import ExportData, FundamentalData, PriceData, SignalEvent
 from sqlalchemy.orm import sessionmaker
 
 app = typer.Typer()
 
 
-@app.command()
-def main(
-    ticker: str = typer.Option(..., help="Stock ticker symbol (e.g., NVDA, RELIANCE.NS)"),
-    output: str = typer.Option(..., help="Output file path (JSON or CSV)"),
-    start: str = typer.Option(None, help="Start date (YYYY-MM-DD) for analysis"),
-    end: str = typer.Option(None, help="End date (YYYY-MM-DD) for analysis"),
-    format: str = typer.Option("json", help="Output format: json or csv"),
-):
+def _output_path(output: str, ticker: str, multiple: bool) -> str:
+    """Return the per-ticker output path; suffix the ticker when analysing several."""
+    if not multiple:
+        return output
+    path = Path(output)
+    return str(path.with_name(f"{path.stem}_{ticker.lower()}{path.suffix}"))
+
+
+def analyze_ticker(
+    session, ticker: str, raw_data: dict, output: str, start: str, end: str, format: str
+) -> bool:
     """
-    Run the full financial analysis pipeline for a given ticker.
+    Process, persist and export already-fetched data for one ticker.
 
     Args:
-            ticker (str): Stock ticker symbol (e.g., NVDA, RELIANCE.NS)
+            session: SQLAlchemy session.
+            ticker (str): Stock ticker symbol.
+            raw_data (dict): Result of fetch_stock_data for the ticker.
             output (str): Output file path
             start (str): Start date (YYYY-MM-DD)
             end (str): End date (YYYY-MM-DD)
             format (str): Output format: json or csv
+
+    Returns:
+            bool: True if the analysis completed and was exported.
     """
-    # Setup logging
-    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
     logging.info(f"Starting analysis for {ticker}")
-
-    # Initialize DB
-    db_path = "financial_data.db"
-    engine = init_db(db_path)
-    Session = sessionmaker(bind=engine)
-    session = Session()
-
-    # Fetch and validate data
-    raw_data = fetch_stock_data(ticker)
-    if not raw_data["prices"]:
-        logging.error("No price data available. Exiting.")
-        raise typer.Exit(code=1)
+    if not len(raw_data["prices"]):
+        logging.error(f"No price data available for {ticker}.")
+        return False
 
     # Optionally filter by date range
     if start or end:
@@ -53,11 +50,13 @@ def main(
 
         start_dt = datetime.date.fromisoformat(start) if start else None
         end_dt = datetime.date.fromisoformat(end) if end else None
-        raw_data["prices"] = [
-            p
-            for p in raw_data["prices"]
-            if (not start_dt or p.date >= start_dt) and (not end_dt or p.date <= end_dt)
-        ]
+        prices = raw_data["prices"]
+        in_range = np.ones(len(prices), dtype=bool)
+        if start_dt:
+            in_range &= prices.date >= np.datetime64(start_dt)
+        if end_dt:
+            in_range &= prices.date <= np.datetime64(end_dt)
+        raw_data["prices"] = prices.select(in_range)
         if raw_data["fundamentals"]:
             raw_data["fundamentals"] = [
                 f
@@ -65,28 +64,31 @@ def main(
                 if (not start_dt or f.as_of >= start_dt) and (not end_dt or f.as_of <= end_dt)
             ]
 
-    # Save ticker info
-    save_ticker(session, ticker)
-
     # Process and calculate metrics
     metrics_df = process_data(raw_data)
     if metrics_df.empty:
-        logging.error("No metrics calculated. Exiting.")
-        raise typer.Exit(code=1)
-    save_daily_metrics(session, ticker, metrics_df)
+        logging.error(f"No metrics calculated for {ticker}.")
+        return False
 
-    # Detect signals
-    golden_cross_dates = detect_golden_crossover(metrics_df)
-    death_cross_dates = detect_death_cross(metrics_df)
-    save_signal_events(session, ticker, "golden_cross", golden_cross_dates)
-    save_signal_events(session, ticker, "death_cross", death_cross_dates)
+    # Signals were flagged by process_data in the same pass as the SMAs
+    golden_cross_dates = metrics_df.loc[metrics_df["golden_cross"], "date"].tolist()
+    death_cross_dates = metrics_df.loc[metrics_df["death_cross"], "date"].tolist()
+
+    # Persist ticker, metrics and signals in one transaction
+    with session.begin():
+        save_ticker(session, ticker)
+        save_daily_metrics(session, ticker, metrics_df)
+        save_signal_events(session, ticker, "golden_cross", golden_cross_dates)
+        save_signal_events(session, ticker, "death_cross", death_cross_dates)
 
     # Prepare export data
     export = ExportData(
         ticker=ticker,
-        price_data=raw_data["prices"],
+        price_data=raw_data["prices"].to_prices(),
         fundamentals=raw_data["fundamentals"],
-        daily_metrics=[row for row in metrics_df.to_dict(orient="records")],
+        daily_metrics=metrics_df.astype(object)
+        .where(metrics_df.notna(), None)
+        .to_dict(orient="records"),
         signals=[
             SignalEvent(date=d, ticker=ticker, signal_type="golden_cross")
             for d in golden_cross_dates
@@ -98,14 +100,106 @@ def main(
 
     # Export to JSON or CSV
     if format.lower() == "json":
+        # Serialize straight to JSON in pydantic-core, without an intermediate dict copy
         with open(output, "w") as f:
-            json.dump(export.dict(), f, default=str, indent=2)
+            f.write(export.model_dump_json(indent=2))
         logging.info(f"Analysis complete. Results saved to {output}")
     elif format.lower() == "csv":
         metrics_df.to_csv(output, index=False)
         logging.info(f"Metrics CSV saved to {output}")
-    else:
-        logging.error("Unsupported output format. Use 'json' or 'csv'.")
+    elif format.lower() == "parquet":
+        export_parquet(output, export, metrics_df)
+        logging.info(f"Parquet files saved alongside {output}")
+    return True
+
+
+def export_parquet(output: str, export: ExportData, metrics_df: pd.DataFrame):
+    """
+    Write daily metrics to `output` and the rest of the export bundle to sibling
+    `<stem>_prices`, `<stem>_fundamentals` and `<stem>_signals` Parquet files (zstd).
+
+    Args:
+            output (str): Output file path for the metrics table.
+            export (ExportData): Export bundle for the ticker.
+            metrics_df (pd.DataFrame): DataFrame of daily metrics.
+    """
+    path = Path(output)
+    metrics_df.to_parquet(path, engine="pyarrow", compression="zstd", index=False)
+    for name, model, records in (
+        ("prices", PriceData, export.price_data),
+        ("fundamentals", FundamentalData, export.fundamentals),
+        ("signals", SignalEvent, export.signals),
+    ):
+        frame = pd.DataFrame([r.model_dump() for r in records], columns=list(model.model_fields))
+        frame.to_parquet(
+            path.with_name(f"{path.stem}_{name}{path.suffix}"),
+            engine="pyarrow",
+            compression="zstd",
+            index=False,
+        )
+
+
+@app.command()
+def main(
+    ticker: str = typer.Option(
+        ..., help="Stock ticker symbol(s), comma-separated (e.g., NVDA,RELIANCE.NS)"
+    ),
+    output: str = typer.Option(
+        ...,
+        help="Output file path (JSON, CSV or Parquet); suffixed per ticker when several are given",
+    ),
+    start: str = typer.Option(None, help="Start date (YYYY-MM-DD) for analysis"),
+    end: str = typer.Option(None, help="End date (YYYY-MM-DD) for analysis"),
+    format: str = typer.Option("json", help="Output format: json, csv or parquet"),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Always re-download instead of reusing cached yfinance data"
+    ),
+):
+    """
+    Run the full financial analysis pipeline for one or more tickers.
+
+    Args:
+            ticker (str): Stock ticker symbol(s), comma-separated (e.g., NVDA,RELIANCE.NS)
+            output (str): Output file path
+            start (str): Start date (YYYY-MM-DD)
+            end (str): End date (YYYY-MM-DD)
+            format (str): Output format: json, csv or parquet
+            no_cache (bool): Bypass the on-disk fetch cache
+    """
+    # Setup logging
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    tickers = [t.strip() for t in ticker.split(",") if t.strip()]
+    if format.lower() not in ("json", "csv", "parquet"):
+        logging.error("Unsupported output format. Use 'json', 'csv' or 'parquet'.")
+        raise typer.Exit(code=1)
+    if format.lower() == "parquet" and importlib.util.find_spec("pyarrow") is None:
+        logging.error("Parquet output requires pyarrow (uv add pyarrow).")
+        raise typer.Exit(code=1)
+
+    # Initialize DB
+    db_path = "financial_data.db"
+    engine = init_db(db_path)
+    Session = sessionmaker(bind=engine)
+    session = Session()
+
+    # Fetch and validate data for all tickers concurrently
+    raw_data_by_ticker = fetch_many_stock_data(tickers, use_cache=not no_cache)
+
+    failed = [
+        t
+        for t in tickers
+        if not analyze_ticker(
+            session,
+            t,
+            raw_data_by_ticker[t],
+            _output_path(output, t, len(tickers) > 1),
+            start,
+            end,
+            format,
+        )
+    ]
+    if failed:
+        logging.error(f"Analysis failed for: {', '.join(failed)}. Exiting.")
         raise typer.Exit(code=1)
 
 
@@ -1,17 +1,22 @@
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass
+from typing import ClassVar
 from pydantic import BaseModel, Field, model_validator, validator
-from typing import Optional, List, Literal
-from decimal import Decimal
+from typing import Optional, List, Literal, Iterable
 from datetime import date
 
 
 class PriceData(BaseModel):
     date: date
-    open: Decimal
-    high: Decimal
-    low: Decimal
-    close: Decimal
+    open: float
+    high: float
+    low: float
+    close: float
     volume: int
 
+    # Single-row check; bulk histories are screened with data_fetcher.invalid_price_mask
+    # and their rows built with model_construct.
     @model_validator(mode="after")
     def check_price_relationships(self):
         if self.high is not None and self.low is not None and self.high < self.low:
@@ -23,39 +28,107 @@ class PriceData(BaseModel):
         return self
 
 
+@dataclass
+class PriceSeries:
+    """
+    Daily price history stored column-wise (one NumPy array per field) rather than
+    as a list of PriceData objects. Dates are datetime64[D], prices float64, volume int64.
+    """
+
+    date: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+    DTYPES: ClassVar[dict] = {
+        "date": "datetime64[D]",
+        "open": np.float64,
+        "high": np.float64,
+        "low": np.float64,
+        "close": np.float64,
+        "volume": np.int64,
+    }
+
+    def __len__(self) -> int:
+        return len(self.date)
+
+    @classmethod
+    def from_columns(cls, columns: dict) -> "PriceSeries":
+        """Build a series from a mapping of field name to array-like, casting to DTYPES."""
+        return cls(
+            **{name: np.asarray(columns[name], dtype=dtype) for name, dtype in cls.DTYPES.items()}
+        )
+
+    @classmethod
+    def from_prices(cls, prices: Iterable[PriceData]) -> "PriceSeries":
+        """Build a series from PriceData models (e.g. tests or hand-built inputs)."""
+        prices = list(prices)
+        n = len(prices)
+        return cls(
+            **{
+                name: np.fromiter((getattr(p, name) for p in prices), dtype=dtype, count=n)
+                for name, dtype in cls.DTYPES.items()
+            }
+        )
+
+    def to_columns(self) -> dict:
+        """Field name -> list of plain Python values."""
+        return {name: getattr(self, name).tolist() for name in self.DTYPES}
+
+    def select(self, mask: np.ndarray) -> "PriceSeries":
+        """Return the rows where mask is True."""
+        return PriceSeries(**{name: getattr(self, name)[mask] for name in self.DTYPES})
+
+    def to_frame(self) -> pd.DataFrame:
+        return pd.DataFrame({name: getattr(self, name) for name in self.DTYPES})
+
+    def to_prices(self) -> List[PriceData]:
+        """
+        PriceData models for export. Rows are assumed already screened (see
+        data_fetcher.invalid_price_mask), so validators are skipped via model_construct.
+        """
+        columns = self.to_columns()
+        return [
+            PriceData.model_construct(**dict(zip(columns, values)))
+            for values in zip(*columns.values())
+        ]
+
+
 class FundamentalData(BaseModel):
     as_of: date
     ticker: str
-    book_value: Optional[Decimal]
-    total_assets: Optional[Decimal]
-    total_liabilities: Optional[Decimal]
-    pe_ratio: Optional[Decimal]
-    pb_ratio: Optional[Decimal]
-    eps: Optional[Decimal]
-    revenue: Optional[Decimal]
-    net_income: Optional[Decimal]
-    enterprise_value: Optional[Decimal]
+    book_value: Optional[float]
+    total_assets: Optional[float]
+    total_liabilities: Optional[float]
+    pe_ratio: Optional[float]
+    pb_ratio: Optional[float]
+    eps: Optional[float]
+    revenue: Optional[float]
+    net_income: Optional[float]
+    enterprise_value: Optional[float]
     source: Literal["quarterly", "annual", "info"]
 
 
 class DailyMetrics(BaseModel):
     date: date
     ticker: str
-    close: Decimal
-    sma_50: Optional[Decimal]
-    sma_200: Optional[Decimal]
-    high_52w: Optional[Decimal]
-    pct_from_high_52w: Optional[Decimal]
-    book_value_per_share: Optional[Decimal]
-    price_to_book: Optional[Decimal]
-    enterprise_value: Optional[Decimal]
+    close: float
+    sma_50: Optional[float]
+    sma_200: Optional[float]
+    high_52w: Optional[float]
+    pct_from_high_52w: Optional[float]
+    book_value_per_share: Optional[float]
+    price_to_book: Optional[float]
+    enterprise_value: Optional[float]
 
 
 class SignalEvent(BaseModel):
     date: date
     ticker: str
     signal_type: Literal["golden_cross", "death_cross"]
-    meta: Optional[dict]
+    meta: Optional[dict] = None
 
 
 class ExportData(BaseModel):
@@ -1,58 +1,264 @@
+import numpy as np
 import pandas as pd
-from typing import List
+from typing import AbstractSet, Dict, List, Optional, Tuple
 import logging
+import weakref
+from ._kernels import HAVE_COMPILED_CROSSES, HAVE_NUMBA, find_crosses, find_crosses_batch
 
+_log = logging.getLogger(__name__)
 
-def detect_golden_crossover(df: pd.DataFrame) -> List[pd.Timestamp]:
+# Below this many rows the vectorized NumPy path beats the compiled kernel's call overhead
+COMPILED_MIN_ROWS = 10_000
+
+_NO_DATES = np.empty(0, dtype="datetime64[ns]")
+_NO_DATES.flags.writeable = False
+
+# id(df) -> (copies of the input arrays, (golden, death)); dropped when the frame is collected
+_cache: Dict[int, Tuple[Tuple[np.ndarray, ...], Tuple[np.ndarray, np.ndarray]]] = {}
+
+
+def _same_inputs(cached: Tuple[np.ndarray, ...], inputs: Tuple[np.ndarray, ...]) -> bool:
+    # Compare values, not buffers, so in-place .loc/.iloc writes invalidate the entry. Numeric
+    # and datetime arrays are compared bitwise through int64 views (NaN/NaT match themselves)
+    for old, new in zip(cached, inputs):
+        if old.shape != new.shape:
+            return False
+        if new.dtype.kind in "fmM" and new.dtype.itemsize == 8 and old.dtype == new.dtype:
+            old, new = old.view(np.int64), new.view(np.int64)
+        if not np.array_equal(old, new):
+            return False
+    return True
+
+
+def _find_crosses_numpy(sma_50: np.ndarray, sma_200: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Row positions of golden and death crosses, vectorized over the whole series."""
+    # One subtraction gives both the comparison and validity (NaN in either SMA -> NaN diff).
+    # Compare each valid row with the previous valid row; NaN rows are skipped
+    diff = sma_50 - sma_200
+    valid = np.flatnonzero(~np.isnan(diff))
+    if len(valid) < 2:
+        return valid[:0], valid[:0]
+    # -1/0/+1 for SMA-50 below/equal/above SMA-200; crossings are edges in this signal.
+    # Golden: prev <= 0 and curr == +1, i.e. a rising edge landing on +1 (death mirrors it).
+    sign = np.sign(diff[valid]).astype(np.int8)
+    curr = sign[1:]
+    edge = curr - sign[:-1]
+    golden = (edge > 0) & (curr == 1)
+    death = (edge < 0) & (curr == -1)
+    return valid[1:][golden], valid[1:][death]
+
+
+def _to_timestamps(dates: np.ndarray) -> List[pd.Timestamp]:
+    """Box crossover dates for Python consumers, in bulk for datetime64 arrays."""
+    if dates.dtype.kind == "M":
+        return pd.DatetimeIndex(dates).tolist()
+    return dates.tolist()
+
+
+def detect_sma_crossovers_arr(
+    sma_50: np.ndarray, sma_200: np.ndarray, dates: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Array primitive behind :func:`detect_sma_crossovers`: golden and death cross dates from
+    parallel float64 SMA arrays and their dates, without touching pandas.
+
+    Args:
+            sma_50 (np.ndarray): 50-day SMA values (NaN where undefined).
+            sma_200 (np.ndarray): 200-day SMA values (NaN where undefined).
+            dates (np.ndarray): Dates aligned with the SMA arrays.
+
+    Returns:
+            Tuple[np.ndarray, np.ndarray]: Golden cross dates, death cross dates, gathered from
+                    the date array (``datetime64[ns]`` for any datetime64 unit).
+    """
+    if HAVE_COMPILED_CROSSES and len(sma_50) > COMPILED_MIN_ROWS:
+        golden_pos, death_pos = find_crosses(sma_50, sma_200)
+    else:
+        golden_pos, death_pos = _find_crosses_numpy(sma_50, sma_200)
+    golden, death = dates[golden_pos], dates[death_pos]
+    if dates.dtype.kind == "M":
+        # process_data frames carry datetime64[s]; normalise the (short) results to one unit
+        golden = golden.astype("datetime64[ns]", copy=False)
+        death = death.astype("datetime64[ns]", copy=False)
+    return golden, death
+
+
+def detect_crossovers_batch(
+    sma_50_2d: np.ndarray, sma_200_2d: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Crossover positions for many tickers at once, one ticker per row of the 2-D SMA arrays.
+    Rows are scanned in parallel when numba is installed.
+
+    Args:
+            sma_50_2d (np.ndarray): ``(n_tickers, n_days)`` 50-day SMA values.
+            sma_200_2d (np.ndarray): ``(n_tickers, n_days)`` 200-day SMA values.
+
+    Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]: ``(golden_starts, golden_idx,
+            death_starts, death_idx)``; ticker ``t``'s golden cross columns are
+            ``golden_idx[golden_starts[t]:golden_starts[t + 1]]`` (death likewise).
+    """
+    sma_50_2d = np.ascontiguousarray(sma_50_2d, dtype=np.float64)
+    sma_200_2d = np.ascontiguousarray(sma_200_2d, dtype=np.float64)
+    if HAVE_NUMBA:
+        return find_crosses_batch(sma_50_2d, sma_200_2d)
+    rows = [_find_crosses_numpy(a, b) for a, b in zip(sma_50_2d, sma_200_2d)]
+    golden = [g for g, _ in rows]
+    death = [d for _, d in rows]
+    return (
+        np.concatenate(([0], np.cumsum([len(g) for g in golden]))).astype(np.int64),
+        np.concatenate(golden).astype(np.int64) if rows else np.empty(0, dtype=np.int64),
+        np.concatenate(([0], np.cumsum([len(d) for d in death]))).astype(np.int64),
+        np.concatenate(death).astype(np.int64) if rows else np.empty(0, dtype=np.int64),
+    )
+
+
+def detect_golden_crossover_arr(
+    sma_50: np.ndarray, sma_200: np.ndarray, dates: np.ndarray
+) -> np.ndarray:
+    """Golden cross dates from SMA arrays; see :func:`detect_sma_crossovers_arr`."""
+    return detect_sma_crossovers_arr(sma_50, sma_200, dates)[0]
+
+
+def detect_death_cross_arr(
+    sma_50: np.ndarray, sma_200: np.ndarray, dates: np.ndarray
+) -> np.ndarray:
+    """Death cross dates from SMA arrays; see :func:`detect_sma_crossovers_arr`."""
+    return detect_sma_crossovers_arr(sma_50, sma_200, dates)[1]
+
+
+def detect_sma_crossovers(
+    df: pd.DataFrame, columns: Optional[AbstractSet[str]] = None, cache: bool = False
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Detect Golden Crossovers (50-day SMA crosses above 200-day SMA) and Death Crosses
+    (50-day SMA crosses below 200-day SMA) in a single pass over the SMA columns.
+    Handles edge cases (insufficient data, NaN values).
+
+    With ``cache=True`` the result is kept per DataFrame until it is garbage-collected, for
+    callers that re-ask about the same frame repeatedly. A hit is only served when the SMA and
+    date values still equal a private copy taken at scan time, so any edit forces a rescan.
+
+    Args:
+            df (pd.DataFrame): DataFrame with 'date', 'sma_50' and 'sma_200' columns.
+            columns (AbstractSet[str], optional): Column names of ``df``; batch callers
+                    checking many same-shaped frames can pass a frozenset built once.
+            cache (bool): Reuse the previous result for an unchanged ``df``. Off by default,
+                    since validating the copies only pays off over several repeat calls.
+
+    Returns:
+            Tuple[np.ndarray, np.ndarray]: Golden cross dates, death cross dates, gathered from
+                    the date array (``datetime64[ns]`` for any datetime64 unit).
+    """
+    cols = df.columns if columns is None else columns
+    if "sma_50" not in cols or "sma_200" not in cols:
+        _log.debug("SMA columns missing for crossover detection: %s", cols)
+        return _NO_DATES, _NO_DATES
+    if not cache:
+        # Series.count is one C loop per column; skips building any mask for empty/near-empty SMAs
+        if min(df["sma_50"].count(), df["sma_200"].count()) < 2:
+            return _NO_DATES, _NO_DATES
+        return detect_sma_crossovers_arr(
+            df["sma_50"].to_numpy(dtype=np.float64),
+            df["sma_200"].to_numpy(dtype=np.float64),
+            df["date"].to_numpy(),
+        )
+    sma_50 = df["sma_50"]
+    sma_200 = df["sma_200"]
+    inputs = (
+        sma_50.to_numpy(dtype=np.float64),
+        sma_200.to_numpy(dtype=np.float64),
+        df["date"].to_numpy(),
+    )
+    key = id(df)
+    hit = _cache.get(key)
+    if hit is not None and _same_inputs(hit[0], inputs):
+        return hit[1]
+    if min(sma_50.count(), sma_200.count()) < 2:
+        result = _NO_DATES, _NO_DATES
+    else:
+        result = detect_sma_crossovers_arr(*inputs)
+    # Results are shared between callers, so hand them out read-only
+    for dates in result:
+        dates.flags.writeable = False
+    if hit is None:
+        weakref.finalize(df, _cache.pop, key, None)
+    _cache[key] = (tuple(array.copy() for array in inputs), result)
+    return result
+
+
+def detect_golden_crossover(df: pd.DataFrame) -> np.ndarray:
     """
     Detect Golden Crossovers (50-day SMA crosses above 200-day SMA).
-    Returns a list of crossover dates.
+    Returns an array of crossover dates.
     Handles edge cases (insufficient data, NaN values).
 
     Args:
             df (pd.DataFrame): DataFrame with 'sma_50' and 'sma_200' columns.
 
     Returns:
-            List[pd.Timestamp]: List of crossover dates.
-    """
-    if "sma_50" not in df or "sma_200" not in df:
-        logging.warning("SMA columns missing for crossover detection.")
-        return []
-    # Ensure no NaNs for comparison
-    mask = df["sma_50"].notna() & df["sma_200"].notna()
-    if mask.sum() < 2:
-        return []
-    sma_50 = df.loc[mask, "sma_50"]
-    sma_200 = df.loc[mask, "sma_200"]
-    prev = sma_50.shift(1) <= sma_200.shift(1)
-    curr = sma_50 > sma_200
-    cross = prev & curr
-    crossover_dates = df.loc[mask].loc[cross].index.to_list()
-    return [df.loc[i, "date"] for i in crossover_dates]
-
-
-def detect_death_cross(df: pd.DataFrame) -> List[pd.Timestamp]:
+            np.ndarray: Crossover dates (``datetime64[ns]`` for a datetime64 'date' column
+                    of any unit).
+    """
+    return detect_sma_crossovers(df)[0]
+
+
+def detect_death_cross(df: pd.DataFrame) -> np.ndarray:
     """
     Detect Death Crosses (50-day SMA crosses below 200-day SMA).
-    Returns a list of crossover dates.
+    Returns an array of crossover dates.
     Handles edge cases (insufficient data, NaN values).
 
     Args:
             df (pd.DataFrame): DataFrame with 'sma_50' and 'sma_200' columns.
 
     Returns:
-            List[pd.Timestamp]: List of crossover dates.
-    """
-    if "sma_50" not in df or "sma_200" not in df:
-        logging.warning("SMA columns missing for crossover detection.")
-        return []
-    mask = df["sma_50"].notna() & df["sma_200"].notna()
-    if mask.sum() < 2:
-        return []
-    sma_50 = df.loc[mask, "sma_50"]
-    sma_200 = df.loc[mask, "sma_200"]
-    prev = sma_50.shift(1) >= sma_200.shift(1)
-    curr = sma_50 < sma_200
-    cross = prev & curr
-    crossover_dates = df.loc[mask].loc[cross].index.to_list()
-    return [df.loc[i, "date"] for i in crossover_dates]
+            np.ndarray: Crossover dates (``datetime64[ns]`` for a datetime64 'date' column
+                    of any unit).
+    """
+    return detect_sma_crossovers(df)[1]
+
+
+def detect_golden_crossover_py(df: pd.DataFrame) -> List[pd.Timestamp]:
+    """:func:`detect_golden_crossover` as a list of Timestamps, for Python consumers."""
+    return _to_timestamps(detect_golden_crossover(df))
+
+
+def detect_death_cross_py(df: pd.DataFrame) -> List[pd.Timestamp]:
+    """:func:`detect_death_cross` as a list of Timestamps, for Python consumers."""
+    return _to_timestamps(detect_death_cross(df))
+
+
+class CrossoverDetector:
+    """
+    Incremental crossover detector for streaming SMA values: keeps only the sign of
+    SMA-50 minus SMA-200 on the last valid row, so each update is O(1).
+    Matches :func:`detect_sma_crossovers` on the same sequence of rows.
+    """
+
+    __slots__ = ("_prev_sign",)
+
+    def __init__(self, prev_sign: Optional[int] = None):
+        self._prev_sign = prev_sign
+
+    @classmethod
+    def from_history(cls, df: pd.DataFrame) -> "CrossoverDetector":
+        """Warm up from the last row of ``df`` where both SMAs are defined."""
+        diff = df["sma_50"].to_numpy(dtype=np.float64) - df["sma_200"].to_numpy(dtype=np.float64)
+        valid = np.flatnonzero(~np.isnan(diff))
+        return cls(int(np.sign(diff[valid[-1]])) if len(valid) else None)
+
+    def update(self, sma_50: float, sma_200: float) -> int:
+        """
+        Feed the next row. Returns +1 on a golden cross, -1 on a death cross, 0 otherwise.
+        Rows with a NaN SMA are ignored and leave the state unchanged.
+        """
+        diff = sma_50 - sma_200
+        if diff != diff:
+            return 0
+        sign = 1 if diff > 0 else (-1 if diff < 0 else 0)
+        prev_sign, self._prev_sign = self._prev_sign, sign
+        if prev_sign is None or sign == prev_sign:
+            return 0
+        return sign
@@ -0,0 +1,24 @@
+import os
+from financial_analyzer.src.config import load_config, DEFAULT_CONFIG, _load_yaml
+
+
+def test_load_config_defaults_when_missing(tmp_path):
+    config = load_config(str(tmp_path / "missing.yaml"))
+    assert config == DEFAULT_CONFIG
+    assert config is not DEFAULT_CONFIG
+
+
+def test_load_config_cached_until_modified(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text("database:\n  path: a.db\n")
+    _load_yaml.cache_clear()
+    assert load_config(str(path))["database"]["path"] == "a.db"
+    assert load_config(str(path))["database"]["path"] == "a.db"
+    assert _load_yaml.cache_info().hits == 1
+    # Defaults must not be mutated by the merge
+    assert DEFAULT_CONFIG["database"]["path"] == "financial_data.db"
+
+    path.write_text("database:\n  path: b.db\n")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert load_config(str(path))["database"]["path"] == "b.db"
@@ -0,0 +1,58 @@
+import numpy as np
+import pandas as pd
+import financial_analyzer.src.data_fetcher as data_fetcher
+
+
+class FakeTicker:
+    calls = 0
+
+    def __init__(self, ticker):
+        FakeTicker.calls += 1
+
+    def history(self, period, interval):
+        idx = pd.date_range('2023-01-02', periods=5, tz='America/New_York', name='Date')
+        close = np.array([10.0, 11.0, 12.0, 13.0, 14.0])
+        df = pd.DataFrame({'Open': close, 'High': close + 1, 'Low': close - 1, 'Close': close, 'Volume': 100}, index=idx)
+        df.iloc[2, 1] = 0.0  # High below Low -> dropped
+        return df
+
+    quarterly_balance_sheet = pd.DataFrame(
+        {pd.Timestamp('2022-12-31'): [100.0, 500.0]}, index=['Total Stockholder Equity', 'Total Assets']
+    )
+    balance_sheet = pd.DataFrame()
+    info = {}
+
+
+def test_fetch_drops_invalid_rows(monkeypatch):
+    monkeypatch.setattr(data_fetcher.yf, 'Ticker', FakeTicker)
+    result = data_fetcher.fetch_stock_data('TEST')
+    prices = result['prices']
+    assert prices.close.tolist() == [10.0, 11.0, 13.0, 14.0]
+    assert prices.date[0] == np.datetime64('2023-01-02')
+    assert prices.volume.dtype == np.int64
+    assert result['fundamentals'][0].book_value == 100.0
+    assert result['fundamentals'][0].total_liabilities is None
+
+
+def test_fetch_uses_disk_cache(monkeypatch, tmp_path):
+    monkeypatch.setattr(data_fetcher.yf, 'Ticker', FakeTicker)
+    FakeTicker.calls = 0
+    first = data_fetcher.fetch_stock_data('TEST', use_cache=True, cache_dir=str(tmp_path))
+    second = data_fetcher.fetch_stock_data('TEST', use_cache=True, cache_dir=str(tmp_path))
+    assert FakeTicker.calls == 1
+    assert second['prices'].to_columns() == first['prices'].to_columns()
+    assert second['fundamentals'] == first['fundamentals']
+    data_fetcher.fetch_stock_data('TEST', use_cache=True, cache_dir=str(tmp_path), expire_after=0)
+    assert FakeTicker.calls == 2
+
+
+def test_invalid_price_mask():
+    nan = float('nan')
+    mask = data_fetcher.invalid_price_mask(
+        open=np.array([10.0, 10.0, 13.0, 10.0, 10.0]),
+        high=np.array([11.0, 9.0, 12.0, 11.0, 11.0]),
+        low=np.array([9.0, 9.5, 9.0, 9.0, 9.0]),
+        close=np.array([10.0, 9.5, 10.0, 12.0, 10.0]),
+        volume=np.array([1.0, 1.0, 1.0, 1.0, nan]),
+    )
+    assert mask.tolist() == [False, True, True, True, True]
@@ -0,0 +1,99 @@
+import pandas as pd
+from sqlalchemy import select
+from sqlalchemy.orm import sessionmaker
+from financial_analyzer.src.database import (
+    init_db,
+    save_ticker,
+    save_daily_metrics,
+    save_daily_metrics_bulk,
+    save_signal_events,
+    DailyMetric,
+    SignalEvent,
+)
+
+
+def _session(tmp_path):
+    engine = init_db(str(tmp_path / "test.db"))
+    return sessionmaker(bind=engine)()
+
+
+def test_save_daily_metrics_upsert(tmp_path):
+    session = _session(tmp_path)
+    with session.begin():
+        save_ticker(session, "TEST")
+    df = pd.DataFrame({
+        'date': pd.date_range('2023-01-01', periods=3).date,
+        'close': [10.0, 11.0, 12.0],
+        'sma_50': [10.0, 10.5, 11.0],
+        'sma_200': [10.0, 10.5, 11.0],
+        'price_to_book': [None, float('nan'), 1.2],
+    })
+    with session.begin():
+        save_daily_metrics(session, "TEST", df)
+    # Re-running with changed values updates in place instead of duplicating
+    df['close'] = [20.0, 21.0, 22.0]
+    with session.begin():
+        save_daily_metrics(session, "TEST", df)
+    rows = session.execute(select(DailyMetric).order_by(DailyMetric.date)).scalars().all()
+    assert len(rows) == 3
+    assert [float(r.close) for r in rows] == [20.0, 21.0, 22.0]
+    assert rows[1].price_to_book is None
+
+
+def test_save_signal_events_idempotent(tmp_path):
+    session = _session(tmp_path)
+    dates = list(pd.date_range('2023-01-01', periods=2).date)
+    with session.begin():
+        save_signal_events(session, "TEST", "golden_cross", dates)
+        save_signal_events(session, "TEST", "golden_cross", dates)
+        save_signal_events(session, "TEST", "death_cross", [])
+    rows = session.execute(select(SignalEvent)).scalars().all()
+    assert len(rows) == 2
+
+
+def test_save_daily_metrics_bulk(tmp_path):
+    engine = init_db(str(tmp_path / "test.db"))
+    df = pd.DataFrame({
+        'date': pd.date_range('2023-01-01', periods=3000).date,
+        'close': [float(i) for i in range(3000)],
+    })
+    save_daily_metrics_bulk(engine, "TEST", df)
+    save_daily_metrics_bulk(engine, "TEST", df)
+    session = sessionmaker(bind=engine)()
+    assert len(session.execute(select(DailyMetric)).scalars().all()) == 3000
+    with engine.connect() as conn:
+        assert conn.exec_driver_sql("PRAGMA synchronous").scalar() == 1  # NORMAL
+
+
+def test_engine_pragmas(tmp_path):
+    engine = init_db(str(tmp_path / "test.db"))
+    with engine.connect() as conn:
+        assert conn.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
+        assert conn.exec_driver_sql("PRAGMA temp_store").scalar() == 2  # MEMORY
+        assert conn.exec_driver_sql("PRAGMA cache_size").scalar() == -65536
+
+
+def test_init_db_backfills_signal_index(tmp_path):
+    path = str(tmp_path / "test.db")
+    engine = init_db(path)
+    with engine.begin() as conn:
+        conn.exec_driver_sql("DROP INDEX ix_signal_ticker_type_date")
+    engine = init_db(path)
+    with engine.connect() as conn:
+        plan = conn.exec_driver_sql(
+            "EXPLAIN QUERY PLAN SELECT * FROM signal_events "
+            "WHERE ticker='A' AND signal_type='golden_cross' AND date > '2023-01-01'"
+        ).fetchall()
+    assert "ix_signal_ticker_type_date" in str(plan)
+
+
+def test_save_rolls_back_as_one_transaction(tmp_path):
+    session = _session(tmp_path)
+    try:
+        with session.begin():
+            save_ticker(session, "TEST")
+            save_signal_events(session, "TEST", "golden_cross", [pd.Timestamp('2023-01-01').date()])
+            raise RuntimeError("pipeline failed")
+    except RuntimeError:
+        pass
+    assert session.execute(select(SignalEvent)).scalars().all() == []
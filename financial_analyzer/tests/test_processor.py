@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 from financial_analyzer.src.processor import process_data
 from financial_analyzer.src.models import PriceData, FundamentalData
@@ -38,3 +39,60 @@ def test_missing_fundamentals():
 	assert not df.empty
 	assert 'book_value_per_share' in df.columns
 
+
+def test_price_to_book_vectorized():
+	raw_data = {
+		'prices': [
+			PriceData(date=pd.Timestamp('2023-01-02').date(), open=10, high=12, low=9, close=10, volume=1000),
+			PriceData(date=pd.Timestamp('2023-01-03').date(), open=11, high=13, low=10, close=12, volume=1100),
+		],
+		'fundamentals': [
+			FundamentalData(as_of=pd.Timestamp('2022-12-31').date(), ticker='TEST', book_value=5, total_assets=None, total_liabilities=None, pe_ratio=None, pb_ratio=None, eps=None, revenue=None, net_income=None, enterprise_value=None, source='annual'),
+			FundamentalData(as_of=pd.Timestamp('2023-01-03').date(), ticker='TEST', book_value=0, total_assets=None, total_liabilities=None, pe_ratio=None, pb_ratio=None, eps=None, revenue=None, net_income=None, enterprise_value=None, source='annual'),
+		]
+	}
+	df = process_data(raw_data)
+	assert df['price_to_book'].iloc[0] == 2.0
+	assert pd.isna(df['price_to_book'].iloc[1])
+	assert (df['ticker'] == 'TEST').all()
+
+def test_metric_kernels_match_pandas_rolling():
+	from financial_analyzer.src._kernels import _compute_metrics_loop, _compute_metrics_pandas, compute_metrics
+	close = np.random.default_rng(0).uniform(50, 150, size=600)
+	# NaN closes: leading, scattered, and gaps longer than the SMA-50 and 52-week windows
+	with_nan = np.random.default_rng(1).uniform(50, 150, size=1200)
+	with_nan[[0, 5, 100]] = np.nan
+	with_nan[300:360] = np.nan
+	with_nan[600:860] = np.nan
+	for series in (close, with_nan):
+		expected = _compute_metrics_pandas(series)
+		for kernel in (_compute_metrics_loop, compute_metrics):
+			for got, want in zip(kernel(series), expected):
+				np.testing.assert_allclose(got, want, rtol=1e-9)
+
+def test_crossover_flags_match_signal_detectors():
+	from financial_analyzer.src.signals import detect_golden_crossover, detect_golden_crossover_py, detect_death_cross_py
+	rng = np.random.default_rng(1)
+	close = 100 + np.cumsum(rng.normal(0, 2, size=800))
+	close = np.clip(close, 1, None)
+	dates = pd.date_range('2020-01-01', periods=len(close)).date
+	raw_data = {
+		'prices': [PriceData(date=d, open=c, high=c, low=c, close=c, volume=1) for d, c in zip(dates, close)],
+		'fundamentals': []
+	}
+	df = process_data(raw_data)
+	assert detect_golden_crossover(df).dtype == 'datetime64[ns]'
+	assert df.loc[df['golden_cross'], 'date'].tolist() == detect_golden_crossover_py(df)
+	assert df.loc[df['death_cross'], 'date'].tolist() == detect_death_cross_py(df)
+	assert df['golden_cross'].any() and df['death_cross'].any()
+
+def test_crossover_flags_survive_nan_close():
+	from financial_analyzer.src._kernels import _compute_metrics_pandas, compute_metrics
+	rng = np.random.default_rng(1)
+	close = np.clip(100 + np.cumsum(rng.normal(0, 2, size=800)), 1, None)
+	close[10] = np.nan
+	*_, golden, death = compute_metrics(close)
+	*_, want_golden, want_death = _compute_metrics_pandas(close)
+	np.testing.assert_array_equal(golden, want_golden)
+	np.testing.assert_array_equal(death, want_death)
+	assert golden[11:].any() and death[11:].any()
@@ -1,5 +1,11 @@
+import numpy as np
 import pandas as pd
-from financial_analyzer.src.signals import detect_golden_crossover, detect_death_cross
+from financial_analyzer.src.signals import (
+	detect_golden_crossover,
+	detect_death_cross,
+	detect_golden_crossover_py,
+	detect_death_cross_py,
+)
 
 def test_golden_and_death_cross():
 	# Simulate SMA data
@@ -10,8 +16,10 @@ def test_golden_and_death_cross():
 	})
 	golden = detect_golden_crossover(df)
 	death = detect_death_cross(df)
-	assert isinstance(golden, list)
-	assert isinstance(death, list)
+	assert isinstance(golden, np.ndarray) and golden.dtype == 'datetime64[ns]'
+	assert isinstance(death, np.ndarray) and death.dtype == 'datetime64[ns]'
+	assert isinstance(detect_golden_crossover_py(df), list)
+	assert isinstance(detect_death_cross_py(df), list)
 	
 
 
@@ -19,11 +27,11 @@ def test_golden_cross_edge_cases():
 	# No SMA columns
 	df = pd.DataFrame({'date': pd.date_range('2023-01-01', periods=3)})
 	golden = detect_golden_crossover(df)
-	assert golden == []
+	assert len(golden) == 0
 	# Not enough data
 	df = pd.DataFrame({'date': pd.date_range('2023-01-01', periods=1), 'sma_50': [1], 'sma_200': [2]})
 	golden = detect_golden_crossover(df)
-	assert golden == []
+	assert len(golden) == 0
 	
 def test_multiple_crosses():
 	# Simulate multiple golden and death crosses
@@ -32,8 +40,8 @@ def test_multiple_crosses():
 		'sma_50': [1, 2, 3, 4, 5, 4, 3, 4, 5, 6],
 		'sma_200': [2, 2, 2, 2, 2, 3, 4, 3, 2, 1]
 	})
-	golden = detect_golden_crossover(df)
-	death = detect_death_cross(df)
+	golden = detect_golden_crossover_py(df)
+	death = detect_death_cross_py(df)
 	# There should be at least one golden and one death cross
 	assert any(isinstance(d, pd.Timestamp) or isinstance(d, pd._libs.tslibs.timestamps.Timestamp) for d in golden)
 	assert any(isinstance(d, pd.Timestamp) or isinstance(d, pd._libs.tslibs.timestamps.Timestamp) for d in death)
@@ -47,8 +55,8 @@ def test_no_crosses():
     })
     golden = detect_golden_crossover(df)
     death = detect_death_cross(df)
-    assert golden == []
-    assert death == []
+    assert len(golden) == 0
+    assert len(death) == 0
 
 def test_nan_values():
     # SMA columns with NaN values
@@ -59,8 +67,8 @@ def test_nan_values():
     })
     golden = detect_golden_crossover(df)
     death = detect_death_cross(df)
-    assert golden == []
-    assert death == []
+    assert len(golden) == 0
+    assert len(death) == 0
 
 def test_insufficient_data():
     # Only one valid data point
@@ -71,6 +79,165 @@ def test_insufficient_data():
     })
     golden = detect_golden_crossover(df)
     death = detect_death_cross(df)
-    assert golden == []
-    assert death == []
+    assert len(golden) == 0
+    assert len(death) == 0
+
+
+def test_fused_crossovers_match_wrappers():
+    from financial_analyzer.src.signals import detect_sma_crossovers
+    df = pd.DataFrame({
+        'date': pd.date_range('2023-01-01', periods=10),
+        'sma_50': [1, 2, 3, 4, 5, 4, 3, 4, 5, 6],
+        'sma_200': [2, 2, 2, 2, 2, 3, 4, 3, 2, 1]
+    })
+    golden, death = detect_sma_crossovers(df)
+    np.testing.assert_array_equal(golden, detect_golden_crossover(df))
+    np.testing.assert_array_equal(death, detect_death_cross(df))
+    assert detect_golden_crossover_py(df) == [pd.Timestamp('2023-01-03'), pd.Timestamp('2023-01-08')]
+    assert detect_death_cross_py(df) == [pd.Timestamp('2023-01-07')]
+
+def test_streaming_kernel_matches_numpy_path():
+    from financial_analyzer.src._kernels import _find_crosses_loop, find_crosses
+    from financial_analyzer.src.signals import _find_crosses_numpy
+    rng = np.random.default_rng(0)
+    for _ in range(50):
+        s50 = rng.integers(0, 4, 200).astype(float)
+        s200 = rng.integers(0, 4, 200).astype(float)
+        s50[rng.random(200) < 0.1] = np.nan
+        expected = _find_crosses_numpy(s50, s200)
+        out_g, out_d = np.empty(200, dtype=np.int64), np.empty(200, dtype=np.int64)
+        n_g, n_d = _find_crosses_loop(s50, s200, out_g, out_d)
+        assert out_g[:n_g].tolist() == expected[0].tolist()
+        assert out_d[:n_d].tolist() == expected[1].tolist()
+        got = find_crosses(s50, s200)
+        assert got[0].tolist() == expected[0].tolist()
+        assert got[1].tolist() == expected[1].tolist()
+
+def test_streaming_kernel_short_buffers():
+    from financial_analyzer.src._kernels import _find_crosses_jit, _find_crosses_loop, _find_crosses_nb
+    from financial_analyzer.src.signals import _find_crosses_numpy
+    rng = np.random.default_rng(4)
+    s50 = rng.integers(0, 4, 500).astype(float)
+    s200 = rng.integers(0, 4, 500).astype(float)
+    golden, death = _find_crosses_numpy(s50, s200)
+    empty = np.empty(0, dtype=np.int64)
+    for kernel in (_find_crosses_loop, _find_crosses_nb, _find_crosses_jit):
+        assert tuple(kernel(s50, s200, empty, empty)) == (len(golden), len(death))
+        out_g, out_d = np.full(3, -1, dtype=np.int64), np.full(3, -1, dtype=np.int64)
+        assert tuple(kernel(s50, s200, out_g, out_d)) == (len(golden), len(death))
+        assert out_g.tolist() == golden[:3].tolist()
+        assert out_d.tolist() == death[:3].tolist()
 
+def test_crossovers_accept_precomputed_columns():
+    from financial_analyzer.src.signals import detect_sma_crossovers
+    df = pd.DataFrame({"date": pd.date_range("2023-01-01", periods=3), "sma_50": [1.0, 3.0, 1.0], "sma_200": [2.0] * 3})
+    colset = frozenset(df.columns)
+    np.testing.assert_array_equal(detect_sma_crossovers(df, colset), detect_sma_crossovers(df))
+    assert [len(d) for d in detect_sma_crossovers(df, frozenset({"date"}))] == [0, 0]
+
+def test_array_primitives_match_dataframe_adapters():
+    from financial_analyzer.src.signals import detect_golden_crossover_arr, detect_death_cross_arr
+    df = pd.DataFrame({
+        'date': pd.date_range('2023-01-01', periods=6),
+        'sma_50': [1.0, 3.0, np.nan, 1.0, 2.0, 3.0],
+        'sma_200': [2.0] * 6,
+    })
+    s50, s200, dates = df['sma_50'].to_numpy(), df['sma_200'].to_numpy(), df['date'].to_numpy()
+    np.testing.assert_array_equal(detect_golden_crossover_arr(s50, s200, dates), detect_golden_crossover(df))
+    np.testing.assert_array_equal(detect_death_cross_arr(s50, s200, dates), detect_death_cross(df))
+    assert detect_death_cross_py(df) == [pd.Timestamp('2023-01-04')]
+
+def test_streaming_detector_matches_batch():
+    from financial_analyzer.src.signals import CrossoverDetector
+    rng = np.random.default_rng(1)
+    n = 120
+    s50 = rng.integers(0, 4, n).astype(float)
+    s200 = rng.integers(0, 4, n).astype(float)
+    s50[rng.random(n) < 0.1] = np.nan
+    df = pd.DataFrame({'date': pd.date_range('2023-01-01', periods=n), 'sma_50': s50, 'sma_200': s200})
+    detector = CrossoverDetector()
+    fired = [detector.update(a, b) for a, b in zip(s50, s200)]
+    golden = [d for d, f in zip(df['date'], fired) if f == 1]
+    death = [d for d, f in zip(df['date'], fired) if f == -1]
+    assert golden == detect_golden_crossover_py(df)
+    assert death == detect_death_cross_py(df)
+
+    # Warm up on a prefix, then stream the rest
+    warm = CrossoverDetector.from_history(df.iloc[:60])
+    assert [warm.update(a, b) for a, b in zip(s50[60:], s200[60:])] == fired[60:]
+
+def test_batch_crossovers_match_per_ticker(monkeypatch):
+    from financial_analyzer.src import signals
+    rng = np.random.default_rng(2)
+    s50 = rng.integers(0, 4, (8, 100)).astype(float)
+    s200 = rng.integers(0, 4, (8, 100)).astype(float)
+    s50[rng.random((8, 100)) < 0.1] = np.nan
+    for have_numba in (signals.HAVE_NUMBA, False):
+        monkeypatch.setattr(signals, 'HAVE_NUMBA', have_numba)
+        g_starts, g_idx, d_starts, d_idx = signals.detect_crossovers_batch(s50, s200)
+        for t in range(8):
+            golden, death = signals._find_crosses_numpy(s50[t], s200[t])
+            assert g_idx[g_starts[t]:g_starts[t + 1]].tolist() == golden.tolist()
+            assert d_idx[d_starts[t]:d_starts[t + 1]].tolist() == death.tolist()
+
+def test_cython_kernel_matches_numpy_path():
+    import pytest
+    fast = pytest.importorskip('financial_analyzer.src._signals_fast')
+    from financial_analyzer.src.signals import _find_crosses_numpy
+    rng = np.random.default_rng(3)
+    s50 = rng.integers(0, 4, 500).astype(float)
+    s200 = rng.integers(0, 4, 500).astype(float)
+    s200[rng.random(500) < 0.1] = np.nan
+    out_g, out_d = np.empty(500, dtype=np.int64), np.empty(500, dtype=np.int64)
+    n_g, n_d = fast.find_crosses(s50, s200, out_g, out_d)
+    golden, death = _find_crosses_numpy(s50, s200)
+    assert out_g[:n_g].tolist() == golden.tolist()
+    assert out_d[:n_d].tolist() == death.tolist()
+
+def test_cython_kernel_short_buffers():
+    import pytest
+    fast = pytest.importorskip('financial_analyzer.src._signals_fast')
+    from financial_analyzer.src.signals import _find_crosses_numpy
+    rng = np.random.default_rng(4)
+    s50 = rng.integers(0, 4, 500).astype(float)
+    s200 = rng.integers(0, 4, 500).astype(float)
+    golden, death = _find_crosses_numpy(s50, s200)
+    empty = np.empty(0, dtype=np.int64)
+    assert fast.find_crosses(s50, s200, empty, empty) == (len(golden), len(death))
+    out_g, out_d = np.full(3, -1, dtype=np.int64), np.full(3, -1, dtype=np.int64)
+    assert fast.find_crosses(s50, s200, out_g, out_d) == (len(golden), len(death))
+    assert out_g.tolist() == golden[:3].tolist()
+    assert out_d.tolist() == death[:3].tolist()
+
+def test_crossover_results_cached_per_frame():
+    import gc
+    from financial_analyzer.src import signals
+    df = pd.DataFrame({
+        'date': pd.date_range('2023-01-01', periods=4),
+        'sma_50': [1.0, 3.0, 1.0, 3.0],
+        'sma_200': [2.0] * 4,
+    })
+    # Off by default: nothing is stored and each call scans afresh
+    assert signals.detect_sma_crossovers(df)[0] is not signals.detect_sma_crossovers(df)[0]
+    assert id(df) not in signals._cache
+    first = signals.detect_sma_crossovers(df, cache=True)
+    assert signals.detect_sma_crossovers(df, cache=True) is first
+    assert not first[0].flags.writeable
+    # Replacing a column forces a rescan
+    df['sma_200'] = [0.0, 0.0, 0.0, 4.0]
+    golden, death = signals.detect_sma_crossovers(df, cache=True)
+    assert len(golden) == 0
+    np.testing.assert_array_equal(death, df['date'].to_numpy()[3:])
+    # So do in-place cell writes, which keep the column buffers
+    df['sma_200'] = [2.0] * 4
+    assert len(signals.detect_sma_crossovers(df, cache=True)[0]) == 2
+    df.loc[1, 'sma_50'] = 1.0
+    df.loc[3, 'sma_50'] = 1.0
+    assert len(signals.detect_sma_crossovers(df, cache=True)[0]) == 0
+    df.iloc[1:, 1] = 3.0
+    np.testing.assert_array_equal(signals.detect_sma_crossovers(df, cache=True)[0], df['date'].to_numpy()[1:2])
+    assert detect_golden_crossover_py(df) == [pd.Timestamp('2023-01-02')]
+    key = id(df)
+    del df
+    gc.collect()
+    assert key not in signals._cache